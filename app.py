@@ -1,6 +1,10 @@
-# app.py
-import os
-import requests
+# app.py — Streamlit UI only; network and normalization live in scraper/api.py
+# so the import-heavy fetch layer is shared and testable without a UI.
+#
+# Only streamlit is imported at module top: pandas, httpx and the scraper
+# package are deferred into the button branches so the no-interaction
+# cold-start path (what the user sees as time-to-first-paint) skips them.
+# Python's module cache makes the repeat imports on later reruns free.
 import streamlit as st
 
 st.set_page_config(page_title="Contact Crawler", layout="centered")
@@ -12,46 +16,40 @@ st.write("Enter a full URL (https://example.com) or domain (example.com) and hit
 query = st.text_input("URL or domain", placeholder="https://example.com or example.com")
 search_btn = st.button("Search")
 
-# Config / secrets
-RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")  # set in your environment or Streamlit secrets
-RAPIDAPI_HOST = os.getenv("RAPIDAPI_HOST", "email-scraper.p.rapidapi.com")
-# NOTE: If the API you subscribed to uses a different host string, replace it in your environment.
-
-# Helper to call RapidAPI endpoint
-def call_contact_api(target):
-    """
-    Make request to the RapidAPI contact-crawler API.
-    Replace path '/v1/extract' with the actual path shown in the RapidAPI console for your API.
-    """
-    if not RAPIDAPI_KEY:
-        raise RuntimeError("RAPIDAPI_KEY not set in environment. Add it to secrets or env variables.")
-    # Example base URL - adjust endpoint path to the API's documentation in the RapidAPI playground
-    base_url = f"https://{RAPIDAPI_HOST}"
-    endpoint_path = "/v1/extract"  # <-- CHANGE this to match the API's endpoint path in RapidAPI
-    url = base_url + endpoint_path
-
-    headers = {
-        "X-RapidAPI-Key": RAPIDAPI_KEY,
-        "X-RapidAPI-Host": RAPIDAPI_HOST,
-        "Accept": "application/json",
-    }
-    params = {
-        "https://en.wikipedia.org/wiki/Email": target  # many contact-scraper APIs accept 'url' or 'domain' param — check the playground
-    }
-
-    resp = requests.get(url, headers=headers, params=params, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+batch_query = st.text_area("Batch: URLs or domains, one per line", placeholder="example.com\nanother.org")
+batch_btn = st.button("Search all")
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_fetch(target):
+    """In-memory layer over the disk-cached fetch; keyed on the normalized URL."""
+    from scraper import api
+
+    return api.fetch_contacts(target)
+
+
+@st.cache_data(show_spinner=False)
+def cached_normalize(data):
+    """Resolve vendor field aliases once per unique response."""
+    from scraper import api
+
+    return api.normalize(data)
+
 
 # Main interaction
 if search_btn:
     if not query:
         st.error("Please provide a URL or domain.")
     else:
+        import httpx
+        import pandas as pd
+
+        from scraper import api
+
         with st.spinner("Querying API..."):
             try:
-                data = call_contact_api(query.strip())
-            except requests.HTTPError as e:
+                data = cached_fetch(api.normalize_url(query.strip()))
+            except httpx.HTTPStatusError as e:
                 st.error(f"HTTP error: {e} — check your RAPIDAPI_KEY, host, and endpoint path.")
             except Exception as e:
                 st.error(f"Error: {e}")
@@ -63,37 +61,56 @@ if search_btn:
 
                 # Try to normalize common fields if present
                 st.subheader("Parsed Contacts")
-                emails = data.get("emails") or data.get("email") or []
-                phones = data.get("phones") or data.get("phone") or []
-                socials = data.get("socials") or data.get("social_links") or []
-
-                if emails:
-                    st.markdown("**Emails**")
-                    for e in emails:
-                        st.write(e)
-                else:
-                    st.write("No emails found (field 'emails' missing or empty).")
+                contacts = cached_normalize(data)
 
-                if phones:
-                    st.markdown("**Phone numbers**")
-                    for p in phones:
-                        st.write(p)
+                # One dataframe instead of one widget per contact: Streamlit pays
+                # serialization and diff cost per widget, so K rows in one table
+                # beats K st.write calls when results run to dozens of entries.
+                rows = (
+                    [{"type": "email", "value": e} for e in contacts.emails]
+                    + [{"type": "phone", "value": p} for p in contacts.phones]
+                    + [{"type": "social", "value": s} for s in contacts.socials]
+                )
+                if rows:
+                    st.dataframe(pd.DataFrame(rows), use_container_width=True)
                 else:
-                    st.write("No phone numbers found (field 'phones' missing or empty).")
-
-                if socials:
-                    st.markdown("**Social links**")
-                    for s in socials:
-                        st.write(s)
-                else:
-                    st.write("No social links found (field 'socials' missing or empty).")
+                    st.write("No emails, phone numbers or social links found.")
 
                 # If API returns a hierarchical page list or score, show it:
-                pages = data.get("pages") or data.get("results") or []
-                if pages:
+                if contacts.pages:
                     st.subheader("Pages scanned / results")
-                    for idx, page in enumerate(pages[:20], start=1):
+                    for idx, page in enumerate(contacts.pages[:20], start=1):
                         st.markdown(f"**{idx}.** {page.get('url') or page.get('page_url')}")
                         text_snippet = page.get("snippet") or page.get("text") or ""
                         if text_snippet:
                             st.caption(text_snippet[:300] + ("..." if len(text_snippet) > 300 else ""))
+
+if batch_btn:
+    import asyncio
+
+    from scraper import api
+
+    urls = [api.normalize_url(line.strip()) for line in batch_query.splitlines() if line.strip()]
+    if not urls:
+        st.error("Please provide at least one URL or domain.")
+    elif not api.RAPIDAPI_KEY:
+        st.error("RAPIDAPI_KEY not set in environment. Add it to secrets or env variables.")
+    else:
+        # Drop obviously bad lines locally before spending any quota on them.
+        valid = []
+        for url in urls:
+            try:
+                api.validate_url(url)
+            except ValueError as e:
+                st.warning(str(e))
+            else:
+                valid.append(url)
+        urls = valid
+        with st.spinner(f"Querying API for {len(urls)} URLs..."):
+            results = asyncio.run(api.fetch_all(urls))
+        for url, result in zip(urls, results):
+            with st.expander(url):
+                if isinstance(result, Exception):
+                    st.error(f"Error: {result}")
+                else:
+                    st.json(result)
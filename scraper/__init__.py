@@ -0,0 +1,17 @@
+from scraper.api import (
+    Contacts,
+    fetch_all,
+    fetch_contacts,
+    normalize,
+    normalize_url,
+    validate_url,
+)
+
+__all__ = [
+    "Contacts",
+    "fetch_all",
+    "fetch_contacts",
+    "normalize",
+    "normalize_url",
+    "validate_url",
+]
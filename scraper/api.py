@@ -0,0 +1,267 @@
+# scraper/api.py — network + normalization layer, kept free of Streamlit so it
+# can be imported (and tested) without a UI. app.py owns the widgets and the
+# st.cache_data wrappers.
+import asyncio
+import ipaddress
+import os
+import re
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import diskcache
+import httpx
+import orjson
+from aiolimiter import AsyncLimiter
+from urllib.parse import urlparse
+
+# Config / secrets
+RAPIDAPI_KEY = os.getenv("RAPIDAPI_KEY")  # set in your environment or Streamlit secrets
+RAPIDAPI_HOST = os.getenv("RAPIDAPI_HOST", "email-scraper.p.rapidapi.com")
+# NOTE: If the API you subscribed to uses a different host string, replace it in your environment.
+
+API_URL = f"https://{RAPIDAPI_HOST}/v1/extract"  # <-- CHANGE the path to match your API in RapidAPI
+
+# Static headers shared by the sync client and the async batch client.
+_HEADERS = {
+    "X-RapidAPI-Host": RAPIDAPI_HOST,
+    "Accept": "application/json",
+    # Ask for compressed bodies explicitly; httpx auto-decodes, and brotli
+    # typically shrinks scraper JSON severalfold over the wire.
+    "Accept-Encoding": "gzip, br",
+}
+_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+_TIMEOUT = httpx.Timeout(27.0, connect=3.05)
+
+# Module-level HTTP/2 client: the TLS connection to RapidAPI is reused across
+# Streamlit reruns, and with HTTP/2 concurrent requests multiplex as streams
+# over that single connection instead of each needing a pooled socket.
+_CLIENT = httpx.Client(
+    http2=True,
+    headers=_HEADERS,
+    timeout=_TIMEOUT,
+    limits=_LIMITS,
+    transport=httpx.HTTPTransport(retries=3),
+)
+
+# Persistent cache: SQLite-backed (so safe across processes) and survives
+# container restarts/redeploys, which would otherwise re-spend RapidAPI quota
+# on every cold start. app.py layers st.cache_data on top for in-memory hits.
+_DC = diskcache.Cache(".cache/rapidapi", size_limit=256 << 20)
+_DC_TTL = 86400  # seconds
+
+# Token bucket matching the RapidAPI plan quota; smoothing bursts below the
+# server-side limit is cheaper than eating 429s and their retry back-off.
+_LIMITER = AsyncLimiter(int(os.getenv("RAPIDAPI_RATE_PER_SEC", "5")), 1)
+
+# Field names vary across RapidAPI contact-scraper vendors; aliases are tried
+# in order and the first non-empty one wins.
+FIELD_ALIASES = {
+    "emails": ("emails", "email"),
+    "phones": ("phoneNumbers", "phones", "phone"),
+    "socials": ("socialLinks", "socials", "social_media", "social_links"),
+    "pages": ("pages", "results"),
+}
+
+# Compiled once at import; applied to raw page text the API already shipped,
+# which is far cheaper than a second round trip for missing fields.
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+PHONE_RE = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+
+
+@dataclass(slots=True)
+class Contacts:
+    """Normalized scrape result; slots keep the per-result footprint compact."""
+
+    emails: list[str] = field(default_factory=list)
+    phones: list[str] = field(default_factory=list)
+    socials: list[str] = field(default_factory=list)
+    pages: list = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.emails or self.phones or self.socials)
+
+
+def normalize_url(query):
+    """Canonicalize user input so equivalent spellings share one cache key."""
+    target = query if "://" in query else "https://" + query
+    return urlparse(target)._replace(fragment="", query="").geturl().lower().rstrip("/")
+
+
+def validate_url(target):
+    """
+    Fail fast on targets that would otherwise burn a connect timeout (typos,
+    unresolvable hosts) or point the scraper at the Streamlit host itself
+    (localhost / private ranges). Raises ValueError with a user-facing message.
+    """
+    p = urlparse(target)
+    if p.scheme not in {"http", "https"} or not p.netloc:
+        raise ValueError(f"Invalid URL {target!r} — expected something like https://example.com")
+    host = p.hostname or ""
+    if host == "localhost":
+        raise ValueError("Refusing to scrape localhost.")
+    try:
+        ip = ipaddress.ip_address(host)
+    except ValueError:
+        pass  # a hostname, not a literal IP
+    else:
+        if ip.is_private or ip.is_loopback or ip.is_link_local:
+            raise ValueError(f"Refusing to scrape private address {host}.")
+    try:
+        socket.getaddrinfo(host, None)
+    except socket.gaierror:
+        raise ValueError(f"Cannot resolve host {host!r} — check the spelling.")
+
+
+def pick(data, key):
+    """Return the first non-empty alias of `key` in the response, else []."""
+    return next((data[k] for k in FIELD_ALIASES[key] if data.get(k)), [])
+
+
+# Worker pool for the regex fallback in batch mode: scanning many large page
+# blobs is CPU-bound and would stall the event loop between awaits. Created
+# lazily so single-URL searches never pay the fork cost.
+_POOL = None
+
+
+def _pool():
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
+def _extract_from_pages(pages):
+    """Regex-scan the page text blobs for emails and phone numbers."""
+    blob = " ".join(
+        p.get("text") or p.get("snippet") or "" for p in pages if isinstance(p, dict)
+    )
+    return sorted(set(EMAIL_RE.findall(blob))), sorted(set(PHONE_RE.findall(blob)))
+
+
+def normalize(data):
+    """
+    Resolve the vendor field aliases into a Contacts record. When the
+    structured fields come back empty but the response carries raw page text,
+    fall back to a local regex scan instead of re-querying the API.
+    """
+    contacts = Contacts(**{key: pick(data, key) for key in FIELD_ALIASES})
+    if (not contacts.emails or not contacts.phones) and contacts.pages:
+        emails, phones = _extract_from_pages(contacts.pages)
+        contacts.emails = contacts.emails or emails
+        contacts.phones = contacts.phones or phones
+    return contacts
+
+
+def _conditional_get(client, key, headers, params):
+    """
+    GET with HTTP revalidation. Validators (ETag / Last-Modified) from the last
+    successful fetch are kept in the disk cache beyond the freshness TTL; when
+    the TTL has lapsed we send If-None-Match / If-Modified-Since, and a 304
+    lets us reuse the stored body without transferring or re-parsing it.
+    """
+    stale = _DC.get(("validators", key))
+    if stale is not None:
+        etag, last_modified, _ = stale
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    # httpx transport retries only cover connect failures, so honor 429
+    # Retry-After ourselves, mirroring the async path.
+    for attempt in range(3):
+        resp = client.get(API_URL, headers=headers, params=params)
+        if resp.status_code == 429 and attempt < 2:
+            retry_after = resp.headers.get("Retry-After")
+            time.sleep(float(retry_after) if retry_after else 0.5 * 2 ** attempt)
+            continue
+        break
+    if resp.status_code == 304 and stale is not None:
+        return stale[2]
+    resp.raise_for_status()
+    # orjson's native parser is severalfold faster than stdlib json on
+    # string-heavy scraper payloads; feed it the raw bytes directly.
+    data = orjson.loads(resp.content)
+    if resp.headers.get("ETag") or resp.headers.get("Last-Modified"):
+        _DC.set(
+            ("validators", key),
+            (resp.headers.get("ETag"), resp.headers.get("Last-Modified"), data),
+        )
+    return data
+
+
+def fetch_contacts(target):
+    """
+    Fetch the raw API response for a URL or bare domain, serving repeats from
+    the persistent disk cache. Replace the '/v1/extract' path in API_URL with
+    the one shown in the RapidAPI console for your API.
+    """
+    if not RAPIDAPI_KEY:
+        raise RuntimeError("RAPIDAPI_KEY not set in environment. Add it to secrets or env variables.")
+    target = normalize_url(target)
+    validate_url(target)
+
+    if (cached := _DC.get(target)) is not None:
+        return cached
+
+    headers = {
+        "X-RapidAPI-Key": RAPIDAPI_KEY,  # host/accept live on the client defaults
+    }
+    params = {
+        "url": target  # many contact-scraper APIs accept 'url' or 'domain' param — check the playground
+    }
+
+    data = _conditional_get(_CLIENT, target, headers, params)
+    _DC.set(target, data, expire=_DC_TTL)
+    return data
+
+
+async def _one(client, sem, url, retries=3):
+    """
+    Fetch contacts for a single URL, bounded by the rate limiter and the shared
+    semaphore. A 429 is retried after the server-advertised Retry-After delay
+    (falling back to a short exponential back-off) instead of failing the URL.
+
+    When the structured fields come back empty but page text is present, the
+    regex fallback runs in the process pool so the CPU-bound scan does not
+    block the event loop while the rest of the batch is in flight.
+    """
+    for attempt in range(retries + 1):
+        async with _LIMITER:
+            async with sem:
+                resp = await client.get(API_URL, params={"url": url})
+                if resp.status_code == 429 and attempt < retries:
+                    retry_after = resp.headers.get("Retry-After")
+                    delay = float(retry_after) if retry_after else 0.5 * 2 ** attempt
+                    await asyncio.sleep(delay)
+                    continue
+                resp.raise_for_status()
+                data = orjson.loads(resp.content)
+                break
+
+    pages = pick(data, "pages")
+    if pages and (not pick(data, "emails") or not pick(data, "phones")):
+        loop = asyncio.get_running_loop()
+        emails, phones = await loop.run_in_executor(_pool(), _extract_from_pages, pages)
+        if not pick(data, "emails"):
+            data["emails"] = emails
+        if not pick(data, "phones"):
+            data["phones"] = phones
+    return data
+
+
+async def fetch_all(urls):
+    """
+    Fetch contacts for many URLs concurrently. With HTTP/2 the requests
+    multiplex as streams over one TLS connection, the semaphore bounds how
+    many are in flight, and per-URL failures come back as exception objects
+    (return_exceptions=True) rather than killing the batch.
+    """
+    sem = asyncio.Semaphore(16)
+    headers = dict(_HEADERS, **{"X-RapidAPI-Key": RAPIDAPI_KEY})
+    async with httpx.AsyncClient(
+        http2=True, headers=headers, limits=_LIMITS, timeout=_TIMEOUT
+    ) as client:
+        return await asyncio.gather(*(_one(client, sem, u) for u in urls), return_exceptions=True)